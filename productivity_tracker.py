@@ -2,7 +2,7 @@
 Productivity Tracker with Activity Monitoring
 Features: Clock In/Out, Break tracking, Idle detection, Auto-start on boot,
           System sleep/shutdown detection
-Requirements: pip install pynput
+Requirements: pip install pynput (only used where no OS idle counter is available)
 Optional: pip install pywin32 (for Windows enhanced features)
 """
 
@@ -10,41 +10,147 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import time
 import threading
+import queue
 import json
 import os
 import sys
 import platform
-from datetime import datetime, timedelta
-from pynput import mouse, keyboard
+import stat
+import tempfile
+import collections
+import functools
+import ctypes
+import ctypes.util
+from datetime import datetime
 
-if platform.system() == 'Windows':
+_SYSTEM = platform.system()
+
+@functools.lru_cache(maxsize=None)
+def _check_win32():
+    """Return True if pywin32 is usable (imported lazily, probed once)"""
+    if _SYSTEM != 'Windows':
+        return False
     try:
         import win32api
         import win32con
         import win32gui
         import win32ts
-        import ctypes
-        WINDOWS_ADVANCED = True
+        return True
     except ImportError:
-        WINDOWS_ADVANCED = False
         print("⚠️  pywin32 not installed. Advanced Windows features disabled.")
         print("   Install with: pip install pywin32")
+        return False
 
 # Configuration
 CONFIG_FILE = "tracker_config.json"
-LOG_FILE = "activity_log.json"
+LOG_FILE = "activity_log.jsonl"
+LEGACY_LOG_FILE = "activity_log.json"  # Pre-JSONL format, migrated on first start
+LOG_QUEUE_SIZE = 1000
+LOG_BATCH_SIZE = 64
+LOG_BATCH_MS = 500
+LOG_FLUSH_TIMEOUT = 2.0  # seconds
+LOG_PUT_TIMEOUT = 1.0  # seconds to wait for queue space before writing directly
+STATE_SAVE_DELAY_MS = 1000
+ACTIVITY_UPDATE_INTERVAL = 1.0  # seconds
+LOG_DISPLAY_LINES = 20
+LOG_TAIL_BYTES = 64 * 1024
+
+@functools.lru_cache(maxsize=None)
+def _load_idle_reader():
+    """Return a function reporting OS-level idle seconds, or None if unsupported"""
+    try:
+        if _SYSTEM == 'Windows':
+            class LASTINPUTINFO(ctypes.Structure):
+                _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
+            
+            user32 = ctypes.windll.user32
+            kernel32 = ctypes.windll.kernel32
+            kernel32.GetTickCount.restype = ctypes.c_uint
+            lii = LASTINPUTINFO()
+            lii.cbSize = ctypes.sizeof(LASTINPUTINFO)
+            
+            def read_idle():
+                if not user32.GetLastInputInfo(ctypes.byref(lii)):
+                    return None
+                # Both counters are 32-bit milliseconds and wrap every ~49 days
+                return ((kernel32.GetTickCount() - lii.dwTime) & 0xFFFFFFFF) / 1000.0
+        
+        elif _SYSTEM == 'Darwin':
+            quartz = ctypes.CDLL('/System/Library/Frameworks/ApplicationServices.framework/ApplicationServices')
+            seconds_since = quartz.CGEventSourceSecondsSinceLastEventType
+            seconds_since.argtypes = [ctypes.c_int32, ctypes.c_uint32]
+            seconds_since.restype = ctypes.c_double
+            kCGEventSourceStateHIDSystemState = 1
+            kCGAnyInputEventType = 0xFFFFFFFF
+            
+            def read_idle():
+                return seconds_since(kCGEventSourceStateHIDSystemState, kCGAnyInputEventType)
+        
+        elif _SYSTEM == 'Linux':
+            class XScreenSaverInfo(ctypes.Structure):
+                _fields_ = [("window", ctypes.c_ulong), ("state", ctypes.c_int),
+                            ("kind", ctypes.c_int), ("til_or_since", ctypes.c_ulong),
+                            ("idle", ctypes.c_ulong), ("eventMask", ctypes.c_ulong)]
+            
+            xlib = ctypes.CDLL(ctypes.util.find_library('X11') or 'libX11.so.6')
+            xss = ctypes.CDLL(ctypes.util.find_library('Xss') or 'libXss.so.1')
+            xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+            xlib.XOpenDisplay.restype = ctypes.c_void_p
+            xlib.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+            xlib.XDefaultRootWindow.restype = ctypes.c_ulong
+            xss.XScreenSaverAllocInfo.restype = ctypes.POINTER(XScreenSaverInfo)
+            xss.XScreenSaverQueryInfo.argtypes = [ctypes.c_void_p, ctypes.c_ulong,
+                                                  ctypes.POINTER(XScreenSaverInfo)]
+            
+            display = xlib.XOpenDisplay(None)
+            if not display:
+                return None
+            root_window = xlib.XDefaultRootWindow(display)
+            info = xss.XScreenSaverAllocInfo()
+            
+            def read_idle():
+                if not xss.XScreenSaverQueryInfo(display, root_window, info):
+                    return None
+                return info.contents.idle / 1000.0
+        
+        else:
+            return None
+        
+        if read_idle() is None:
+            return None
+        return read_idle
+    except Exception:
+        return None
+
+def _get_system_idle_seconds():
+    """Seconds since the last keyboard/mouse input according to the OS, or None"""
+    read_idle = _load_idle_reader()
+    if read_idle is None:
+        return None
+    try:
+        return read_idle()
+    except Exception:
+        return None
 
 class ProductivityTracker:
     def __init__(self):
         # State variables
         self.is_logged_in = False
         self.is_on_break = False
-        self.last_activity_time = time.time()
+        self.last_activity_time = time.monotonic()
+        self._last_activity_update = 0.0
+        self._last_timestamp = (0, "")
+        self.system_idle_available = _get_system_idle_seconds() is not None
         self.clock_in_time = None
         self.break_start_time = None
         self.total_active_time = 0
         self.total_break_time = 0
         
+        # Text currently shown on the time labels (see _set_text)
+        self._active_text = "Active: 00:00:00"
+        self._idle_text = "Idle: 00:00:00"
+        self._last_activity_text = "Last activity: Never"
+        
         # Configuration
         self.idle_timeout_seconds = 300  # 5 minutes
         self.check_interval_seconds = 10
@@ -52,12 +158,26 @@ class ProductivityTracker:
         # Activity listeners
         self.mouse_listener = None
         self.keyboard_listener = None
-        self.idle_checker_thread = None
-        self.ui_updater_thread = None
+        self.activity_monitoring_active = False
         self.running = True
+        self.shutdown_initiated = False
+        self.hwnd = None
+        self._listener_hwnd = None  # Hidden window owned by setup_windows_handlers
+        self._was_logged_in = False
+        # Wall clock on purpose: monotonic clocks stop while the system sleeps
+        self.last_check_time = time.time()
         
         # Activity log
-        self.activity_log = []
+        self.recent_log = collections.deque(maxlen=LOG_DISPLAY_LINES)
+        self._log_q = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._log_overflowing = False
+        self._log_lock = threading.Lock()
+        threading.Thread(target=self._log_writer, daemon=True).start()
+        
+        # State persistence
+        self._state_dirty = False
+        self._state_save_pending = False
+        self._state_lock = threading.Lock()  # Also saved from the Windows message pump
         
         # Load previous state
         self.load_state()
@@ -65,6 +185,19 @@ class ProductivityTracker:
         # Setup UI
         self.setup_ui()
         
+        # Load existing logs
+        self.load_log()
+        
+        # Start periodic checks on the Tk event loop
+        self._tick_ui()
+        self._tick_idle()
+        self._tick_sleep_gap()
+        
+        # pynput listeners are only needed when the OS idle counter is unavailable;
+        # they live for the whole app and _on_activity ignores events while clocked out
+        if not self.system_idle_available:
+            self.root.after_idle(self.start_activity_monitoring)
+        
         # Check for unexpected shutdown
         self.check_unexpected_shutdown()
         
@@ -161,36 +294,43 @@ class ProductivityTracker:
         self.log_text.pack(fill=tk.BOTH, expand=True)
         log_scroll.config(command=self.log_text.yview)
         
-        # Load existing logs
-        self.refresh_log_display()
-        
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
-        if platform.system() == 'Windows' and WINDOWS_ADVANCED:
+        # wm_frame() needs no pywin32; the win32 probe stays deferred until first use
+        if _SYSTEM == 'Windows':
             self.root.update_idletasks()
             self.hwnd = int(self.root.wm_frame(), 16)
     
     def setup_system_event_handlers(self):
         """Setup platform-specific system event handlers"""
-        system = platform.system()
-        
-        if system == 'Windows':
+        if _SYSTEM == 'Windows':
             self.setup_windows_handlers()
-        elif system == 'Darwin':  # macOS
+        elif _SYSTEM == 'Darwin':  # macOS
             self.setup_macos_handlers()
-        elif system == 'Linux':
+        elif _SYSTEM == 'Linux':
             self.setup_linux_handlers()
-        
-        self.sleep_detector_thread = threading.Thread(
-            target=self.detect_sleep_by_time_gap, daemon=True
-        )
-        self.sleep_detector_thread.start()
     
     def setup_windows_handlers(self):
         """Setup Windows-specific shutdown and sleep handlers"""
-        if not WINDOWS_ADVANCED:
+        if not _check_win32():
             return
         
+        import win32api
+        import win32con
+        import win32gui
+        import win32ts
+        
+        # Resolved once so the message handler is a single dict lookup per message
+        self._def_window_proc = win32gui.DefWindowProc
+        self._wts_session_lock = win32ts.WTS_SESSION_LOCK
+        self._wts_session_unlock = win32ts.WTS_SESSION_UNLOCK
+        self._msg_table = {
+            win32con.WM_QUERYENDSESSION: self._on_query_end_session,
+            win32con.WM_ENDSESSION: self._on_end_session,
+            win32con.WM_POWERBROADCAST: self._on_power_broadcast,
+            0x02B1: self._on_wts_session_change,  # WM_WTSSESSION_CHANGE
+        }
+        
         try:
             wc = win32gui.WNDCLASS()
             wc.lpfnWndProc = self.windows_message_handler
@@ -198,7 +338,7 @@ class ProductivityTracker:
             wc.hInstance = win32api.GetModuleHandle(None)
             
             class_atom = win32gui.RegisterClass(wc)
-            self.hwnd = win32gui.CreateWindow(
+            self._listener_hwnd = win32gui.CreateWindow(
                 class_atom,
                 'ProductivityTrackerListener',
                 0,  # No visible window
@@ -206,7 +346,8 @@ class ProductivityTracker:
                 0, 0, wc.hInstance, None
             )
             
-            win32ts.WTSRegisterSessionNotification(self.hwnd, win32ts.NOTIFY_FOR_THIS_SESSION)
+            win32ts.WTSRegisterSessionNotification(self._listener_hwnd,
+                                                   win32ts.NOTIFY_FOR_THIS_SESSION)
             
             threading.Thread(target=self.windows_message_pump, daemon=True).start()
             
@@ -216,47 +357,57 @@ class ProductivityTracker:
     
     def windows_message_handler(self, hwnd, msg, wparam, lparam):
         """Handle Windows system messages"""
-        try:
-            if msg == win32con.WM_QUERYENDSESSION:
-                self.log_activity("SHUTDOWN_WARNING", "System shutdown/logoff initiated")
-                if self.is_logged_in:
-                    self.clock_out(auto=True, reason="System shutdown detected")
-                return True
-            
-            elif msg == win32con.WM_ENDSESSION:
-                self.shutdown_initiated = True
-                self.log_activity("SHUTDOWN_CONFIRMED", "System shutdown confirmed")
-                self.save_state()
-                return 0
-            
-            elif msg == win32con.WM_POWERBROADCAST:
-                if wparam == 0x0004:  # PBT_APMSUSPEND
-                    self.log_activity("SYSTEM_SUSPEND", "System entering sleep mode")
-                    if self.is_logged_in:
-                        self.clock_out(auto=True, reason="System sleep detected")
-                
-                elif wparam == 0x0012:  # PBT_APMRESUMEAUTOMATIC
-                    self.log_activity("SYSTEM_RESUME", "System resumed from sleep")
-                    if not self.is_logged_in:
-                        self.root.after(2000, self.prompt_clock_in_after_resume)
-                
-                return True
-            
-            elif msg == 0x02B1:  # WM_WTSSESSION_CHANGE
-                if wparam == win32ts.WTS_SESSION_LOCK:
-                    self.log_activity("SESSION_LOCK", "Workstation locked")
-                elif wparam == win32ts.WTS_SESSION_UNLOCK:
-                    self.log_activity("SESSION_UNLOCK", "Workstation unlocked")
-                    self.last_activity_time = time.time()
-                return 0
-            
-        except Exception as e:
-            print(f"Error in message handler: {e}")
+        handler = self._msg_table.get(msg)
+        if handler is not None:
+            try:
+                return handler(wparam, lparam)
+            except Exception as e:
+                print(f"Error in message handler: {e}")
         
-        return win32gui.DefWindowProc(hwnd, msg, wparam, lparam)
+        return self._def_window_proc(hwnd, msg, wparam, lparam)
+    
+    def _on_query_end_session(self, wparam, lparam):
+        """WM_QUERYENDSESSION: clock out before shutdown/logoff"""
+        self.log_activity("SHUTDOWN_WARNING", "System shutdown/logoff initiated")
+        if self.is_logged_in:
+            self.clock_out(auto=True, reason="System shutdown detected")
+        return True
+    
+    def _on_end_session(self, wparam, lparam):
+        """WM_ENDSESSION: persist everything before the process is killed"""
+        self.shutdown_initiated = True
+        self.log_activity("SHUTDOWN_CONFIRMED", "System shutdown confirmed")
+        self._flush_log()
+        self.save_state(durable=True)
+        return 0
+    
+    def _on_power_broadcast(self, wparam, lparam):
+        """WM_POWERBROADCAST: handle sleep and resume"""
+        if wparam == 0x0004:  # PBT_APMSUSPEND
+            self.log_activity("SYSTEM_SUSPEND", "System entering sleep mode")
+            if self.is_logged_in:
+                self.clock_out(auto=True, reason="System sleep detected")
+        
+        elif wparam == 0x0012:  # PBT_APMRESUMEAUTOMATIC
+            self.log_activity("SYSTEM_RESUME", "System resumed from sleep")
+            if not self.is_logged_in:
+                self.root.after(2000, self.prompt_clock_in_after_resume)
+        
+        return True
+    
+    def _on_wts_session_change(self, wparam, lparam):
+        """WM_WTSSESSION_CHANGE: track workstation lock/unlock"""
+        if wparam == self._wts_session_lock:
+            self.log_activity("SESSION_LOCK", "Workstation locked")
+        elif wparam == self._wts_session_unlock:
+            self.log_activity("SESSION_UNLOCK", "Workstation unlocked")
+            self.last_activity_time = time.monotonic()
+        return 0
     
     def windows_message_pump(self):
         """Run Windows message pump"""
+        import win32gui
+        
         try:
             win32gui.PumpMessages()
         except Exception as e:
@@ -341,23 +492,26 @@ class ProductivityTracker:
         except Exception as e:
             self.log_activity("SYSTEM_INIT", f"Linux handler setup: {e}")
     
-    def detect_sleep_by_time_gap(self):
+    def _tick_sleep_gap(self):
         """Universal sleep detector based on time gaps"""
-        while self.running:
-            current_time = time.time()
-            time_gap = current_time - self.last_check_time
-            
-            if time_gap > 120:  # 2 minutes
-                self.log_activity("SYSTEM_RESUME", 
-                                f"Detected system wake (gap: {int(time_gap/60)}m)")
-                
-                if self.is_logged_in:
-                    self.clock_out(auto=True, 
-                                 reason=f"System was sleeping ({int(time_gap/60)} minutes)")
-                    self.root.after(2000, self.prompt_clock_in_after_resume)
+        if not self.running:
+            return
+        
+        current_time = time.time()
+        time_gap = current_time - self.last_check_time
+        
+        if time_gap > 120:  # 2 minutes
+            self.log_activity("SYSTEM_RESUME", 
+                            f"Detected system wake (gap: {int(time_gap/60)}m)")
             
-            self.last_check_time = current_time
-            time.sleep(30)  # Check every 30 seconds
+            if self.is_logged_in:
+                self.clock_out(auto=True, 
+                             reason=f"System was sleeping ({int(time_gap/60)} minutes)")
+                self.root.after(2000, self.prompt_clock_in_after_resume)
+        
+        # Re-read the clock: clock_out's warning dialog may have blocked for a while
+        self.last_check_time = time.time()
+        self.root.after(30000, self._tick_sleep_gap)  # Check every 30 seconds
     
     def prompt_clock_in_after_resume(self):
         """Prompt user to clock in after system resume"""
@@ -370,26 +524,59 @@ class ProductivityTracker:
             if response:
                 self.clock_in()
         
-    def update_activity_time(self):
-        """Callback for pynput to update last activity timestamp"""
-        self.last_activity_time = time.time()
+    def _on_activity(self, *args, **kwargs):
+        """Callback for pynput to update last activity timestamp (at most once per second)"""
+        if not self.is_logged_in or self.is_on_break:
+            return
+        now = time.monotonic()
+        if now - self._last_activity_update >= ACTIVITY_UPDATE_INTERVAL:
+            self._last_activity_update = now
+            self.last_activity_time = now
+        
+    def get_idle_seconds(self):
+        """Seconds since last user activity, or None if no idle source is available"""
+        if self.system_idle_available:
+            system_idle = _get_system_idle_seconds()
+            if system_idle is not None:
+                # last_activity_time still counts app-side resets (clock in, unlock)
+                return min(time.monotonic() - self.last_activity_time, system_idle)
+            
+            # OS idle counter stopped working; switch to pynput from a fresh baseline
+            self.system_idle_available = False
+            self.last_activity_time = time.monotonic()
+            self.start_activity_monitoring()
+        
+        if self.activity_monitoring_active:
+            return time.monotonic() - self.last_activity_time
+        return None
         
     def start_activity_monitoring(self):
         """Start keyboard and mouse listeners"""
+        try:
+            from pynput import mouse, keyboard
+        except ImportError:
+            self.log_activity("SYSTEM_INIT", "pynput not available, idle detection disabled")
+            return
+        except Exception as e:
+            self.log_activity("SYSTEM_INIT", f"Activity monitoring setup: {e}")
+            return
+        
         if not self.mouse_listener:
             self.mouse_listener = mouse.Listener(
-                on_move=lambda x, y: self.update_activity_time(),
-                on_click=lambda x, y, button, pressed: self.update_activity_time()
+                on_move=self._on_activity,
+                on_click=self._on_activity
             )
             self.mouse_listener.start()
         
         if not self.keyboard_listener:
             self.keyboard_listener = keyboard.Listener(
-                on_press=lambda key: self.update_activity_time(),
-                on_release=lambda key: self.update_activity_time()
+                on_press=self._on_activity,
+                on_release=self._on_activity
             )
             self.keyboard_listener.start()
-            
+        
+        self.activity_monitoring_active = True
+    
     def stop_activity_monitoring(self):
         """Stop keyboard and mouse listeners"""
         if self.mouse_listener:
@@ -398,23 +585,29 @@ class ProductivityTracker:
         if self.keyboard_listener:
             self.keyboard_listener.stop()
             self.keyboard_listener = None
+        self.activity_monitoring_active = False
+            
+    def _tick_idle(self):
+        """Periodically check if user has been idle too long"""
+        if not self.running:
+            return
+        
+        if self.is_logged_in and not self.is_on_break:
+            current_idle_time = self.get_idle_seconds()
+            # Without an idle source there is nothing to time out on
+            if current_idle_time is not None and current_idle_time > self.idle_timeout_seconds:
+                self.log_activity("IDLE_TIMEOUT", f"Idle for {int(current_idle_time/60)} minutes")
+                self.clock_out(auto=True, reason="Idle timeout")
+        self.root.after(self.check_interval_seconds * 1000, self._tick_idle)
             
-    def check_idle_status(self):
-        """Continuously check if user has been idle too long"""
-        while self.running:
-            if self.is_logged_in and not self.is_on_break:
-                current_idle_time = time.time() - self.last_activity_time
-                if current_idle_time > self.idle_timeout_seconds:
-                    self.log_activity("IDLE_TIMEOUT", f"Idle for {int(current_idle_time/60)} minutes")
-                    self.clock_out(auto=True, reason="Idle timeout")
-            time.sleep(self.check_interval_seconds)
-            
-    def ui_updater(self):
+    def _tick_ui(self):
         """Update UI elements periodically"""
-        while self.running:
-            if self.is_logged_in:
-                self.update_time_displays()
-            time.sleep(1)
+        if not self.running:
+            return
+        
+        if self.is_logged_in:
+            self.update_time_displays()
+        self.root.after(1000, self._tick_ui)
             
     def update_time_displays(self):
         """Update time labels in UI"""
@@ -424,27 +617,51 @@ class ProductivityTracker:
                 active = self.total_active_time
             else:
                 # Calculate current active time
-                active = self.total_active_time + (time.time() - self.clock_in_time)
+                active = self.total_active_time + (time.monotonic() - self.clock_in_time)
             
-            active_str = str(timedelta(seconds=int(active)))
-            self.active_time_label.config(text=f"Active: {active_str}")
+            active_str = self._fmt_hms(active)
+            self._active_text = self._set_text(self.active_time_label, self._active_text,
+                                               f"Active: {active_str}")
         
         # Update idle time
-        idle_seconds = int(time.time() - self.last_activity_time)
-        idle_str = str(timedelta(seconds=idle_seconds))
-        self.idle_time_label.config(text=f"Idle: {idle_str}")
+        idle = self.get_idle_seconds()
+        if idle is None:
+            self._idle_text = self._set_text(self.idle_time_label, self._idle_text,
+                                             "Idle: --:--:--")
+            self._last_activity_text = self._set_text(self.last_activity_label,
+                                                      self._last_activity_text,
+                                                      "Last activity: Unknown")
+            return
+        idle_seconds = int(idle)
+        idle_str = self._fmt_hms(idle_seconds)
+        self._idle_text = self._set_text(self.idle_time_label, self._idle_text,
+                                         f"Idle: {idle_str}")
         
         # Update last activity
         if idle_seconds < 60:
-            self.last_activity_label.config(text=f"Last activity: {idle_seconds}s ago")
+            last_activity_str = f"Last activity: {idle_seconds}s ago"
         else:
-            self.last_activity_label.config(text=f"Last activity: {idle_seconds//60}m ago")
+            last_activity_str = f"Last activity: {idle_seconds//60}m ago"
+        self._last_activity_text = self._set_text(self.last_activity_label,
+                                                  self._last_activity_text, last_activity_str)
+    
+    def _fmt_hms(self, secs):
+        """Format a duration in seconds as HH:MM:SS"""
+        h, rem = divmod(int(secs), 3600)
+        m, s = divmod(rem, 60)
+        return f"{h:02d}:{m:02d}:{s:02d}"
+    
+    def _set_text(self, label, current, new):
+        """Configure label text only when it differs from what is displayed; returns new"""
+        if current != new:
+            label.config(text=new)
+        return new
     
     def clock_in(self):
         """Clock in to start tracking"""
         self.is_logged_in = True
-        self.clock_in_time = time.time()
-        self.last_activity_time = time.time()
+        self.clock_in_time = time.monotonic()
+        self.last_activity_time = time.monotonic()
         self.total_active_time = 0
         self.total_break_time = 0
         
@@ -453,36 +670,24 @@ class ProductivityTracker:
         self.break_btn.config(state=tk.NORMAL)
         self.clock_out_btn.config(state=tk.NORMAL)
         
-        self.start_activity_monitoring()
-        
-        # Start idle checker
-        if not self.idle_checker_thread or not self.idle_checker_thread.is_alive():
-            self.idle_checker_thread = threading.Thread(target=self.check_idle_status, daemon=True)
-            self.idle_checker_thread.start()
-        
-        # Start UI updater
-        if not self.ui_updater_thread or not self.ui_updater_thread.is_alive():
-            self.ui_updater_thread = threading.Thread(target=self.ui_updater, daemon=True)
-            self.ui_updater_thread.start()
-        
         self.log_activity("CLOCK_IN", "Started work session")
-        self.save_state()
+        self._mark_state_dirty()
         
     def take_break(self):
         """Start a break"""
         if not self.is_on_break:
             self.is_on_break = True
-            self.break_start_time = time.time()
+            self.break_start_time = time.monotonic()
             
             # Save active time before break
             if self.clock_in_time:
-                self.total_active_time += (time.time() - self.clock_in_time)
+                self.total_active_time += (time.monotonic() - self.clock_in_time)
             
             self.status_label.config(text="🟡 On Break", fg="#FF9800")
             self.break_btn.config(text="▶️ Resume")
             
             self.log_activity("BREAK_START", "Started break")
-            self.save_state()
+            self._mark_state_dirty()
         else:
             self.resume_work()
     
@@ -490,18 +695,18 @@ class ProductivityTracker:
         """Resume work after break"""
         if self.is_on_break:
             # Calculate break duration
-            break_duration = time.time() - self.break_start_time
+            break_duration = time.monotonic() - self.break_start_time
             self.total_break_time += break_duration
             
             self.is_on_break = False
-            self.clock_in_time = time.time()  # Reset clock in time for new active period
-            self.last_activity_time = time.time()
+            self.clock_in_time = time.monotonic()  # Reset clock in time for new active period
+            self.last_activity_time = time.monotonic()
             
             self.status_label.config(text="🟢 Active", fg="#4CAF50")
             self.break_btn.config(text="⏸️ Break")
             
             self.log_activity("BREAK_END", f"Resumed work (break: {int(break_duration/60)}m)")
-            self.save_state()
+            self._mark_state_dirty()
     
     def clock_out(self, auto=False, reason="Manual clock out"):
         """Clock out and stop tracking"""
@@ -510,11 +715,11 @@ class ProductivityTracker:
             
         # Calculate final times
         if self.is_on_break:
-            break_duration = time.time() - self.break_start_time
+            break_duration = time.monotonic() - self.break_start_time
             self.total_break_time += break_duration
         else:
             if self.clock_in_time:
-                self.total_active_time += (time.time() - self.clock_in_time)
+                self.total_active_time += (time.monotonic() - self.clock_in_time)
         
         self.is_logged_in = False
         self.is_on_break = False
@@ -524,11 +729,9 @@ class ProductivityTracker:
         self.break_btn.config(state=tk.DISABLED, text="⏸️ Break")
         self.clock_out_btn.config(state=tk.DISABLED)
         
-        self.stop_activity_monitoring()
-        
         # Log the session summary
-        active_str = str(timedelta(seconds=int(self.total_active_time)))
-        break_str = str(timedelta(seconds=int(self.total_break_time)))
+        active_str = self._fmt_hms(self.total_active_time)
+        break_str = self._fmt_hms(self.total_break_time)
         
         self.log_activity("CLOCK_OUT", 
                          f"{reason} | Active: {active_str} | Breaks: {break_str}")
@@ -538,61 +741,120 @@ class ProductivityTracker:
         self.total_active_time = 0
         self.total_break_time = 0
         
-        self.save_state()
+        self._mark_state_dirty()
         
         if auto:
             messagebox.showwarning("Auto Clock Out", 
                                   f"You have been automatically clocked out due to: {reason}")
     
+    def _now_str(self):
+        """Current local time as a log timestamp, formatted at most once per second"""
+        second = int(time.time())
+        cached_second, cached_str = self._last_timestamp
+        if second != cached_second:
+            cached_str = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+            self._last_timestamp = (second, cached_str)
+        return cached_str
+    
     def log_activity(self, event_type, details):
         """Add entry to activity log"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = self._now_str()
         entry = {
             "timestamp": timestamp,
             "event": event_type,
             "details": details
         }
-        self.activity_log.append(entry)
+        self.recent_log.append(entry)
         
-        # Keep only last 100 entries
-        if len(self.activity_log) > 100:
-            self.activity_log = self.activity_log[-100:]
+        line = json.dumps(entry, separators=(",", ":"))
+        try:
+            self._log_q.put_nowait(line)
+        except queue.Full:
+            if not self._log_overflowing:
+                self._log_overflowing = True
+                print("⚠️  Log queue full, applying back-pressure")
+            try:
+                self._log_q.put(line, timeout=LOG_PUT_TIMEOUT)
+            except queue.Full:
+                self._write_log_overflow(line)
         
-        self.save_log()
-        self.refresh_log_display()
+        self._append_log_line(entry)
     
     def refresh_log_display(self):
-        """Update log text widget"""
+        """Redraw log text widget from the recent entries"""
         self.log_text.delete(1.0, tk.END)
-        for entry in reversed(self.activity_log[-20:]):  # Show last 20
+        for entry in reversed(self.recent_log):
             log_line = f"[{entry['timestamp']}] {entry['event']}: {entry['details']}\n"
             self.log_text.insert(tk.END, log_line)
     
+    def _append_log_line(self, entry):
+        """Prepend a single entry to the log text widget (newest first)"""
+        log_line = f"[{entry['timestamp']}] {entry['event']}: {entry['details']}\n"
+        self.log_text.insert("1.0", log_line)
+        self.log_text.delete(f"{LOG_DISPLAY_LINES}.end", tk.END)
+    
     def update_settings(self):
         """Update settings from UI"""
         self.idle_timeout_seconds = self.idle_timeout_var.get() * 60
-        self.save_state()
+        self._mark_state_dirty()
     
     def check_unexpected_shutdown(self):
         """Check if app was closed while logged in"""
-        if hasattr(self, '_was_logged_in') and self._was_logged_in:
+        if self._was_logged_in:
             self.log_activity("UNEXPECTED_SHUTDOWN", 
                             "Detected unexpected shutdown - auto-clocking in")
             messagebox.showinfo("Welcome Back", 
                               "Detected previous session was interrupted. Auto-clocking you in.")
             self.root.after(1000, self.clock_in)
     
-    def save_state(self):
-        """Save current state to file"""
+    def _mark_state_dirty(self):
+        """Schedule a coalesced state save"""
+        self._state_dirty = True
+        if not self._state_save_pending:
+            self._state_save_pending = True
+            self.root.after(STATE_SAVE_DELAY_MS, self._do_save_state)
+    
+    def _do_save_state(self):
+        """Write state to file if it changed since the last save"""
+        self._state_save_pending = False
+        if self._state_dirty:
+            self.save_state()
+    
+    def save_state(self, durable=False):
+        """Save current state to file (fsync'd only when durable is set)"""
+        self._state_dirty = False
         state = {
             "is_logged_in": self.is_logged_in,
             "is_on_break": self.is_on_break,
             "idle_timeout_minutes": self.idle_timeout_var.get(),
             "last_save": datetime.now().isoformat()
         }
+        config_dir = os.path.dirname(os.path.abspath(CONFIG_FILE))
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(state, f)
+            with self._state_lock:
+                fd, tmp = tempfile.mkstemp(prefix=".tracker_config.", suffix=".tmp",
+                                           dir=config_dir)
+                try:
+                    with os.fdopen(fd, 'w') as f:
+                        json.dump(state, f, separators=(",", ":"))
+                        if durable:
+                            f.flush()
+                            os.fsync(f.fileno())
+                    # mkstemp creates files as 0600; keep the existing config's mode
+                    if os.path.exists(CONFIG_FILE):
+                        os.chmod(tmp, stat.S_IMODE(os.stat(CONFIG_FILE).st_mode))
+                    os.replace(tmp, CONFIG_FILE)
+                except Exception:
+                    os.remove(tmp)
+                    raise
+                
+                # Make the rename itself durable (directories can't be opened on Windows)
+                if durable and _SYSTEM != 'Windows':
+                    dir_fd = os.open(config_dir, os.O_RDONLY)
+                    try:
+                        os.fsync(dir_fd)
+                    finally:
+                        os.close(dir_fd)
         except Exception as e:
             print(f"Error saving state: {e}")
     
@@ -609,23 +871,125 @@ class ProductivityTracker:
             print(f"Error loading state: {e}")
             self._was_logged_in = False
     
-    def save_log(self):
-        """Save activity log to file"""
+    def _log_writer(self):
+        """Background writer: drain the log queue and append entries in batches"""
+        while True:
+            item = self._log_q.get()
+            batch = []
+            waiters = []
+            deadline = time.monotonic() + LOG_BATCH_MS / 1000
+            while True:
+                if isinstance(item, threading.Event):
+                    waiters.append(item)  # Flush request: write what we have now
+                    break
+                batch.append(item)
+                if len(batch) >= LOG_BATCH_SIZE:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._log_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            
+            self._write_log_lines(batch)
+            for waiter in waiters:
+                waiter.set()
+            if self._log_q.empty():
+                self._log_overflowing = False  # Overflow episode over; warn again next time
+    
+    def _write_log_lines(self, lines):
+        """Append serialized log entries to the JSONL log file"""
+        with self._log_lock:
+            self._append_log_file(lines)
+    
+    def _append_log_file(self, lines):
+        """Append lines to the log file; caller must hold _log_lock"""
+        if not lines:
+            return
+        
         try:
-            with open(LOG_FILE, 'w') as f:
-                json.dump(self.activity_log, f, indent=2)
+            with open(LOG_FILE, 'a') as f:
+                f.write("\n".join(lines) + "\n")
         except Exception as e:
             print(f"Error saving log: {e}")
     
+    def _write_log_overflow(self, line):
+        """Writer is stuck: write the queued entries, then this one, in order"""
+        waiters = []
+        with self._log_lock:
+            lines = []
+            while True:
+                try:
+                    item = self._log_q.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    lines.append(item)
+            lines.append(line)
+            self._append_log_file(lines)
+        
+        for waiter in waiters:
+            waiter.set()
+    
+    def _flush_log(self):
+        """Block until entries logged so far have been written (bounded wait)"""
+        done = threading.Event()
+        try:
+            self._log_q.put(done, timeout=LOG_FLUSH_TIMEOUT)
+        except queue.Full:
+            return
+        done.wait(LOG_FLUSH_TIMEOUT)
+    
+    def _migrate_legacy_log(self):
+        """Convert an old activity_log.json array into the JSONL log, once"""
+        if os.path.exists(LOG_FILE) or not os.path.exists(LEGACY_LOG_FILE):
+            return
+        
+        try:
+            with open(LEGACY_LOG_FILE, 'r') as f:
+                entries = json.load(f)
+            self._write_log_lines([json.dumps(e, separators=(",", ":")) for e in entries])
+        except Exception as e:
+            print(f"Error migrating {LEGACY_LOG_FILE}: {e}")
+    
     def load_log(self):
-        """Load activity log from file"""
+        """Load the most recent activity log entries from the end of the file"""
+        self._migrate_legacy_log()
         try:
             if os.path.exists(LOG_FILE):
-                with open(LOG_FILE, 'r') as f:
-                    self.activity_log = json.load(f)
+                with open(LOG_FILE, 'rb') as f:
+                    f.seek(0, os.SEEK_END)
+                    start = max(0, f.tell() - LOG_TAIL_BYTES)
+                    f.seek(start)
+                    data = f.read()
+                
+                if data and not data.endswith(b"\n"):
+                    # Terminate a torn last line so the next append starts on a fresh line
+                    with self._log_lock:
+                        with open(LOG_FILE, 'ab') as f:
+                            f.write(b"\n")
+                
+                lines = data.split(b"\n")
+                if start > 0:
+                    lines = lines[1:]  # First line is likely partial
+                
+                self.recent_log = collections.deque(maxlen=LOG_DISPLAY_LINES)
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    try:
+                        self.recent_log.append(json.loads(line))
+                    except ValueError:
+                        pass  # Skip a torn write from an unclean exit
         except Exception as e:
             print(f"Error loading log: {e}")
-            self.activity_log = []
+            self.recent_log = collections.deque(maxlen=LOG_DISPLAY_LINES)
+        
+        self.refresh_log_display()
     
     def on_closing(self):
         """Handle window close"""
@@ -642,11 +1006,17 @@ class ProductivityTracker:
         self.running = False
         
         self.stop_activity_monitoring()
+        self._flush_log()
+        self.save_state(durable=True)
         
-        if platform.system() == 'Windows' and WINDOWS_ADVANCED and self.hwnd:
+        # Only set once pywin32 was loaded, so exit never triggers the win32 probe
+        if self._listener_hwnd:
+            import win32gui
+            import win32ts
+            
             try:
-                win32ts.WTSUnRegisterSessionNotification(self.hwnd)
-                win32gui.DestroyWindow(self.hwnd)
+                win32ts.WTSUnRegisterSessionNotification(self._listener_hwnd)
+                win32gui.DestroyWindow(self._listener_hwnd)
             except:
                 pass
         
@@ -654,7 +1024,6 @@ class ProductivityTracker:
     
     def run(self):
         """Start the application"""
-        self.load_log()
         self.root.mainloop()
 
 # Startup functions